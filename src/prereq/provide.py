@@ -18,26 +18,125 @@ from collections.abc import (
 from contextlib import (
     AbstractAsyncContextManager,
     AbstractContextManager,
-    asynccontextmanager,
-    contextmanager,
 )
+from dataclasses import dataclass
 from enum import Enum
+from functools import cache
 from inspect import (
+    CO_ASYNC_GENERATOR,
+    CO_COROUTINE,
+    CO_GENERATOR,
     isasyncgenfunction,
     iscoroutinefunction,
     isgeneratorfunction,
 )
+from types import FunctionType, MethodType, TracebackType
 from typing import (
     Any,
-    NamedTuple,
+    ClassVar,
+    Generic,
     Protocol,
     get_type_hints,
     overload,
 )
+from weakref import WeakKeyDictionary
 
 
-class _ProviderSpec[T, F: Callable[..., Any]](NamedTuple):
-    coverage: Iterable[type[T] | type[Any]]
+class _GeneratorContext[T]:
+    __slots__: tuple[str, ...] = ("_gen",)
+
+    def __init__(self, gen: Iterator[T]) -> None:
+        self._gen: Iterator[T] = gen
+
+    def __enter__(self) -> T:
+        try:
+            return next(self._gen)
+        except StopIteration:
+            no_yield = "generator didn't yield"
+            raise RuntimeError(no_yield) from None
+
+    def __exit__(
+        self,
+        typ: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool:
+        if value is None:
+            try:
+                _ = next(self._gen)
+            except StopIteration:
+                return False
+        else:
+            try:
+                _ = self._gen.throw(value)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownVariableType, reportUnknownMemberType]
+            except StopIteration as stop:
+                return stop is not value
+            except BaseException as error:
+                # Generators turn a StopIteration thrown into them into a
+                # RuntimeError (PEP 479), which stands for the original error.
+                if error is value or (
+                    isinstance(value, StopIteration) and error.__cause__ is value
+                ):
+                    return False
+                raise
+        try:
+            no_stop = "generator didn't stop"
+            raise RuntimeError(no_stop)
+        finally:
+            self._gen.close()  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+
+
+class _AsyncGeneratorContext[T]:
+    __slots__: tuple[str, ...] = ("_gen",)
+
+    def __init__(self, gen: AsyncIterator[T]) -> None:
+        self._gen: AsyncIterator[T] = gen
+
+    async def __aenter__(self) -> T:
+        try:
+            return await anext(self._gen)
+        except StopAsyncIteration:
+            no_yield = "generator didn't yield"
+            raise RuntimeError(no_yield) from None
+
+    async def __aexit__(
+        self,
+        typ: type[BaseException] | None,
+        value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool:
+        if value is None:
+            try:
+                _ = await anext(self._gen)
+            except StopAsyncIteration:
+                return False
+        else:
+            try:
+                _ = await self._gen.athrow(value)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownVariableType, reportUnknownMemberType]
+            except StopAsyncIteration as stop:
+                return stop is not value
+            except BaseException as error:
+                # Async generators also wrap a StopAsyncIteration (PEP 479).
+                if error is value or (
+                    isinstance(value, StopIteration | StopAsyncIteration)
+                    and error.__cause__ is value
+                ):
+                    return False
+                raise
+        try:
+            no_stop = "generator didn't stop"
+            raise RuntimeError(no_stop)
+        finally:
+            await self._gen.aclose()  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]
+
+
+_SYNC, _ASYNC, _SYNC_GEN, _ASYNC_GEN = range(4)
+
+
+@dataclass(frozen=True, slots=True)
+class _ProviderSpec[T, F: Callable[..., Any]]:
+    kind: ClassVar[int]
+    coverage: tuple[type[T] | type[Any], ...]
     args: dict[str, type[Any]]
     level: int
     never_cache: bool
@@ -49,14 +148,18 @@ class SyncProvider[**P, T](_ProviderSpec[T, Callable[P, T]]):
     Wrap a synchronous provider function.
 
     Attributes:
-        coverage (Iterable[type[T | Any]]): The types this provider handles.
+        coverage (tuple[type[T | Any], ...]): The types this provider handles.
         args (dict[str, type[Any]]): The provider's arguement types.
         level (int): The level this provider operates on.
         never_cache (bool): If the provider should be cached after being called.
         factory (F): The function wrapped by this provider.
+        kind (int): How the provider is called, shared by every instance.
 
     """
 
+    __slots__: ClassVar[Iterable[str]] = ()
+    kind: ClassVar[int] = _SYNC
+
     def __call__(self, *args: P.args, **kwds: P.kwargs) -> T:  # noqa: D102
         return self.factory(*args, **kwds)
 
@@ -66,16 +169,20 @@ class SyncProviderGen[**P, T](_ProviderSpec[T, Callable[P, Iterator[T]]]):
     Wrap a synchronous context provider function.
 
     Attributes:
-        coverage (Iterable[type[T | Any]]): The types this provider handles.
+        coverage (tuple[type[T | Any], ...]): The types this provider handles.
         args (dict[str, type[Any]]): The provider's arguement types.
         level (int): The level this provider operates on.
         never_cache (bool): If the provider should be cached after being called.
         factory (F): The generator which will become a context manager.
+        kind (int): How the provider is called, shared by every instance.
 
     """
 
+    __slots__: ClassVar[Iterable[str]] = ()
+    kind: ClassVar[int] = _SYNC_GEN
+
     def __call__(self, *args: P.args, **kwds: P.kwargs) -> AbstractContextManager[T]:  # noqa: D102
-        return contextmanager(self.factory)(*args, **kwds)
+        return _GeneratorContext(self.factory(*args, **kwds))
 
 
 class AsyncProvider[**P, T](_ProviderSpec[T, Callable[P, Awaitable[T]]]):
@@ -83,16 +190,20 @@ class AsyncProvider[**P, T](_ProviderSpec[T, Callable[P, Awaitable[T]]]):
     Wrap an asynchronous provider function.
 
     Attributes:
-        coverage (Iterable[type[T | Any]]): The types this provider handles.
+        coverage (tuple[type[T | Any], ...]): The types this provider handles.
         args (dict[str, type[Any]]): The provider's arguement types.
         level (int): The level this provider operates on.
         never_cache (bool): If the provider should be cached after being called.
         factory (F): The function wrapped by this provider.
+        kind (int): How the provider is called, shared by every instance.
 
     """
 
-    async def __call__(self, *args: P.args, **kwds: P.kwargs) -> T:  # noqa: D102
-        return await self.factory(*args, **kwds)
+    __slots__: ClassVar[Iterable[str]] = ()
+    kind: ClassVar[int] = _ASYNC
+
+    def __call__(self, *args: P.args, **kwds: P.kwargs) -> Awaitable[T]:  # noqa: D102
+        return self.factory(*args, **kwds)
 
 
 class AsyncProviderGen[**P, T](_ProviderSpec[T, Callable[P, AsyncIterator[T]]]):
@@ -100,38 +211,93 @@ class AsyncProviderGen[**P, T](_ProviderSpec[T, Callable[P, AsyncIterator[T]]]):
     Wrap an asynchronous context provider function.
 
     Attributes:
-        coverage (Iterable[type[T | Any]]): The types this provider handles.
+        coverage (tuple[type[T | Any], ...]): The types this provider handles.
         args (dict[str, type[Any]]): The provider's arguement types.
         level (int): The level this provider operates on.
         never_cache (bool): If the provider should be cached after being called.
         factory (F): The async generator which will become a context manager.
+        kind (int): How the provider is called, shared by every instance.
 
     """
 
+    __slots__: ClassVar[Iterable[str]] = ()
+    kind: ClassVar[int] = _ASYNC_GEN
+
     def __call__(  # noqa: D102
         self,
         *args: P.args,
         **kwds: P.kwargs,
     ) -> AbstractAsyncContextManager[T]:
-        return asynccontextmanager(self.factory)(*args, **kwds)
+        return _AsyncGeneratorContext(self.factory(*args, **kwds))
+
+
+_STOP_TYPES: frozenset[Any] = frozenset({object, type, Protocol, Generic, ABC})
 
 
-def _get_parents(typ: type[Any]) -> list[Any]:
-    stop_types = (object, type, Protocol, ABC)
-    total: list[type[Any]] = []
+@cache
+def _get_parents(typ: type[Any]) -> tuple[type[Any], ...]:
+    if typ.__bases__ == (object,):
+        return ()
+    return tuple(base for base in typ.__mro__[1:] if base not in _STOP_TYPES)
 
-    for base in typ.__bases__:
-        if base not in stop_types and hasattr(base, "__bases__"):
-            total.append(base)
-            total += _get_parents(base)
 
-    return total
+_TYPE_HINTS: WeakKeyDictionary[Callable[..., Any], dict[str, Any]] = \
+    WeakKeyDictionary()
+
+
+def _read_type_hints(factory: Callable[..., Any]) -> dict[str, Any]:
+    if isinstance(factory, FunctionType | MethodType):
+        annotations: dict[str, Any] = factory.__annotations__
+        if all(isinstance(hint, type) for hint in annotations.values()):  # pyright: ignore[reportAny]
+            return dict(annotations)
+    return get_type_hints(factory)
+
+
+def _get_type_hints(factory: Callable[..., Any]) -> dict[str, Any]:
+    try:
+        hints = _TYPE_HINTS[factory]
+    except KeyError:
+        hints = _TYPE_HINTS[factory] = _read_type_hints(factory)
+    except TypeError:
+        return _read_type_hints(factory)
+    return dict(hints)
+
+
+def _code_flags(factory: Callable[..., Any]) -> int:
+    code = getattr(factory, "__code__", None)
+    if code is not None and (
+        flags := code.co_flags & (CO_ASYNC_GENERATOR | CO_COROUTINE | CO_GENERATOR)  # pyright: ignore[reportAny]
+    ):
+        return flags  # pyright: ignore[reportAny]
+
+    # Partials, callable objects, and functions marked with markcoroutinefunction
+    # need inspect. Anything else has already been checked.
+    marker = "_is_coroutine_marker"
+    if code is not None and not (
+        hasattr(factory, marker)
+        or hasattr(getattr(factory, "__func__", None), marker)
+    ):
+        return 0
+    if isasyncgenfunction(factory):
+        return CO_ASYNC_GENERATOR
+    if iscoroutinefunction(factory):
+        return CO_COROUTINE
+    if isgeneratorfunction(factory):
+        return CO_GENERATOR
+    return 0
 
 Providers = SyncProvider[Any, Any] |\
                        SyncProviderGen[Any, Any] |\
                        AsyncProvider[Any, Any] |\
                        AsyncProviderGen[Any, Any]
 
+_PROVIDER_KINDS: dict[int, type[Providers]] = {
+    CO_ASYNC_GENERATOR: AsyncProviderGen,
+    CO_COROUTINE: AsyncProvider,
+    CO_GENERATOR: SyncProviderGen,
+    0: SyncProvider,
+}
+
 class _ProviderWrapper[**P, T](Protocol):
 
     @overload
@@ -201,7 +367,7 @@ def provides[**P, T](
     never_cache: bool = False,
 ) -> _ProviderWrapper[P, T]: ...
 
-def provides[**P, T](  # noqa: C901
+def provides[**P, T](
     factory: None | \
              Callable[P, Awaitable[T]] | \
              Callable[P, AsyncIterator[T]] | \
@@ -265,8 +431,15 @@ def provides[**P, T](  # noqa: C901
         (:py:class:`.SyncProviderGen`): If the factory is a synchronous generator.
 
     """
-
-    def create_provider(  # noqa: C901
+    if isinstance(level, Enum):
+        if not isinstance(level.value, int):  # pyright: ignore[reportAny]
+            bad_enum = f"Enum levels must be integers, not {level.value}"  # pyright: ignore[reportAny]
+            raise TypeError(bad_enum)
+        level_value: int = level.value
+    else:
+        level_value = level
+
+    def create_provider(
         factory: Callable[P, Awaitable[T]] | \
                  Callable[P, AsyncIterator[T]] | \
                  Callable[P, Iterator[T]] | \
@@ -275,14 +448,14 @@ def provides[**P, T](  # noqa: C901
          AsyncProviderGen[P, T] | \
          SyncProviderGen[P, T] | \
          SyncProvider[P, T]:
-        nonlocal coverage, level, cover_parents, never_cache
-
-        hints = get_type_hints(factory)
+        hints = _get_type_hints(factory)
 
-        if coverage is None:
+        if coverage is not None:
+            provided = tuple(coverage)
+        else:
             returns: type[Any] | None = hints.pop("return", None)  # pyright: ignore[reportAny]
-            if hasattr(returns, "__args__"):
-                returns = returns.__args__[0]  # pyright: ignore[reportOptionalMemberAccess, reportAny]
+            if (generic_args := getattr(returns, "__args__", None)) is not None:
+                returns = generic_args[0]  # pyright: ignore[reportAny]
 
             if returns is None:
                 missing_return = f"{factory} is missing a return type annotation."
@@ -292,49 +465,17 @@ def provides[**P, T](  # noqa: C901
             if not isinstance(returns, type):  # pyright: ignore[reportUnnecessaryIsInstance]
                 raise TypeError(no_literal)  # pyright: ignore[reportUnreachable]
 
-            coverage = [returns]
-
-            if cover_parents:
-                coverage += _get_parents(returns)
+            provided = (returns, *_get_parents(returns)) if cover_parents \
+                else (returns,)
 
         _ = hints.pop("return", None)  # pyright: ignore[reportAny]
 
-        if isinstance(level, Enum):
-            if not isinstance(level.value, int):  # pyright: ignore[reportAny]
-                bad_enum = f"Enum levels must be integers, not {level.value}"  # pyright: ignore[reportAny]
-                raise TypeError(bad_enum)
-            level = level.value
-
-        if isasyncgenfunction(factory):
-            return AsyncProviderGen[P, T](
-                coverage=coverage,
-                args=hints,
-                level=level,
-                never_cache=never_cache,
-                factory=factory,
-            )
-        if iscoroutinefunction(factory):
-            return AsyncProvider[P, T](
-                coverage=coverage,
-                args=hints,
-                level=level,
-                never_cache=never_cache,
-                factory=factory,
-            )
-        if isgeneratorfunction(factory):
-            return SyncProviderGen[P, T](
-                coverage=coverage,
-                args=hints,
-                level=level,
-                never_cache=never_cache,
-                factory=factory,
-            )
-        return SyncProvider[P, T](
-            coverage=coverage,
-            args=hints,
-            level=level,
-            never_cache=never_cache,
-            factory=factory,  # pyright: ignore[reportArgumentType]
+        return _PROVIDER_KINDS[_code_flags(factory)](
+            provided,
+            hints,
+            level_value,
+            never_cache,
+            factory,  # pyright: ignore[reportArgumentType]
         )
 
     if factory is not None:
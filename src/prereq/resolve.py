@@ -9,27 +9,145 @@ resolvers should be used.
 """
 from __future__ import annotations
 
+from asyncio import FIRST_COMPLETED, Task, gather, get_running_loop, wait
 from collections import defaultdict
-from contextlib import (
-    AbstractAsyncContextManager,
-    AbstractContextManager,
-    asynccontextmanager,
-)
-from dataclasses import dataclass, field
-from types import MappingProxyType
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import FrozenInstanceError, dataclass, field
+from graphlib import CycleError, TopologicalSorter
+from types import FunctionType, MappingProxyType
 from typing import (
     TYPE_CHECKING,
     Any,
-    get_type_hints,
+    NamedTuple,
+    override,
 )
+from weakref import WeakKeyDictionary
 
 from prereq.errors import ProviderNotFoundError
-from prereq.provide import AsyncProvider, Providers, SyncProvider, SyncProviderGen
+from prereq.provide import (
+    _ASYNC,  # pyright: ignore[reportPrivateUsage]
+    _ASYNC_GEN,  # pyright: ignore[reportPrivateUsage]
+    _SYNC,  # pyright: ignore[reportPrivateUsage]
+    _SYNC_GEN,  # pyright: ignore[reportPrivateUsage]
+    Providers,
+    _get_type_hints,  # pyright: ignore[reportPrivateUsage]
+)
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Callable, Mapping
+    from collections.abc import AsyncGenerator, Callable, Iterable, Mapping
+
+_Node = tuple[int, type[Any]]
+_MISSING = object()
+
+
+class _Ref(NamedTuple):
+    typ: type[Any]
+    nodes: tuple[_Node, ...]
+    node: _Node | None
+
+
+class _Step(NamedTuple):
+    provider: Providers
+    tag: int
+    invoke: Callable[..., Any]
+    positional: bool
+    never_cache: bool
+    names: tuple[str, ...]
+    refs: tuple[_Ref, ...]
+    requires: frozenset[_Node]
+
+
+def _positional(factory: Callable[..., Any], names: Iterable[str]) -> bool:
+    if not isinstance(factory, FunctionType):
+        return False
+    code = factory.__code__
+    return code.co_varnames[:code.co_argcount] == tuple(names)
+
 
 @dataclass(frozen=True, slots=True)
+class Plan:
+    """
+    Precomputed provider lookups for a set of named types.
+
+    Plans are built by :py:meth:`prereq.resolve.Scope.compile`, and only depend on
+    the providers available to a scope. Cached values are checked when the plan is
+    executed, so a plan can be reused by any scope on the same level of a resolver.
+
+    Attributes:
+        targets (tuple[tuple[str, _Ref], ...]): The requested types, by name.
+        steps (dict[_Node, _Step]): Every provider the targets may need, along with
+            how to call it and where to find its arguments.
+        order (tuple[_Node, ...] | None): Every step, with dependencies before the
+            providers that use them. None if providers depend on each other in a
+            loop, which a cached value may break, so the order is worked out when
+            the plan is executed.
+        awaits (frozenset[_Node]): Providers that have to be awaited, because they
+            are asynchronous or create an uncached dependency that is.
+        caches (frozenset[_Node]): Providers whose values are kept in their scope's
+            cache once created.
+
+    """
+
+    targets: tuple[tuple[str, _Ref], ...]
+    steps: dict[_Node, _Step]
+    order: tuple[_Node, ...] | None
+    awaits: frozenset[_Node]
+    caches: frozenset[_Node]
+
+
+@dataclass(slots=True)
+class _Batch:
+    plan: Plan
+    scopes: dict[int, Scope]
+    values: dict[_Node, Any] = field(default_factory=dict)
+    needed: set[_Node] = field(default_factory=set)
+    missing: set[_Node] = field(default_factory=set)
+    order: tuple[_Node, ...] = ()
+
+
+def _link(steps: dict[_Node, _Step], order: tuple[_Node, ...]) -> frozenset[_Node]:
+    awaits = {node for node, step in steps.items() if step.tag in {_ASYNC, _ASYNC_GEN}}
+
+    # Dependencies usually come first, so this settles after one pass. Plans with
+    # a loop need a few more.
+    changed = True
+    while changed:
+        changed = False
+        for node in order:
+            step = steps[node]
+            requires: set[_Node] = set()
+            blocks = False
+            for dep in step.refs:
+                if dep.node is None:
+                    continue
+                if not steps[dep.node].never_cache:
+                    requires.add(dep.node)
+                    continue
+                requires.update(steps[dep.node].requires)
+                blocks = blocks or dep.node in awaits
+            if blocks and node not in awaits:
+                awaits.add(node)
+                changed = True
+            if not step.requires.issuperset(requires):
+                steps[node] = step._replace(requires=frozenset(requires))
+                changed = True
+    return frozenset(awaits)
+
+
+def _hit(ref: _Ref, values: dict[_Node, Any]) -> Any:  # noqa: ANN401  # pyright: ignore[reportAny]
+    for node in ref.nodes:
+        if (value := values.get(node, _MISSING)) is not _MISSING:  # pyright: ignore[reportAny]
+            return value  # pyright: ignore[reportAny]
+    return _MISSING
+
+
+def _dep(ref: _Ref, values: dict[_Node, Any]) -> _Node | None:
+    for node in ref.nodes:
+        if node in values:
+            return node
+    return ref.node
+
+
 class Scope:
     """
     Temporary cache and context manager.
@@ -52,15 +170,75 @@ class Scope:
 
     """
 
-    parent: Scope | None
-    level: int
-    providers: MappingProxyType[type[Any], Providers]
+    __slots__: tuple[str, ...] = (
+        "_exits",
+        "_plans",
+        "_scopes",
+        "cache",
+        "level",
+        "parent",
+        "providers",
+    )
+
+    parent: Scope | None  # pyright: ignore[reportUninitializedInstanceVariable]
+    level: int  # pyright: ignore[reportUninitializedInstanceVariable]
+    providers: MappingProxyType[type[Any], Providers]  # pyright: ignore[reportUninitializedInstanceVariable]
+    cache: dict[type[Any], Any]  # pyright: ignore[reportUninitializedInstanceVariable]
+    _exits: AsyncExitStack  # pyright: ignore[reportUninitializedInstanceVariable]
+    _scopes: dict[int, Scope]  # pyright: ignore[reportUninitializedInstanceVariable]
+    _plans: dict[type[Any], dict[int, Plan]]  # pyright: ignore[reportUninitializedInstanceVariable]
+
+    def __init__(
+        self,
+        parent: Scope | None,
+        level: int,
+        providers: MappingProxyType[type[Any], Providers],
+        plans: dict[type[Any], dict[int, Plan]] | None = None,
+    ) -> None:
+        """
+        Create an empty scope.
+
+        Args:
+            parent (:py:class:`.Scope` | None): The previous level's scope, if
+                applicable.
+            level (int): The level this scope services.
+            providers (MappingProxyType[type[Any], Providers]): Providers on
+                this scope's level.
+            plans (dict[type[Any], dict[int, Plan]], optional): Plans for
+                :py:meth:`prereq.resolve.Scope.get`, by type then level, shared
+                with other scopes using the same providers. Only types with a
+                provider are kept. Defaults to None.
+
+        """
+        scopes: dict[int, Scope] = {level: self}
+        if parent is not None:
+            scopes.update(parent._scopes)  # noqa: SLF001
+
+        setattr_ = object.__setattr__
+        setattr_(self, "parent", parent)
+        setattr_(self, "level", level)
+        setattr_(self, "providers", providers)
+        setattr_(self, "cache", {})
+        setattr_(self, "_exits", AsyncExitStack())
+        setattr_(self, "_scopes", scopes)
+        setattr_(self, "_plans", {} if plans is None else plans)
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"Scope(parent={self.parent!r}, level={self.level!r}, "
+            f"providers={self.providers!r}, cache={self.cache!r})"
+        )
+
+    @override
+    def __setattr__(self, name: str, value: object) -> None:
+        frozen = f"cannot assign to field {name!r}"
+        raise FrozenInstanceError(frozen)
 
-    cache: dict[type[Any], Any] = field(default_factory=dict, init=False)
-    _ctx: list[
-        AbstractAsyncContextManager[type[Any]] |\
-        AbstractContextManager[type[Any]]
-    ] = field(default_factory=list, init=False)
+    @override
+    def __delattr__(self, name: str) -> None:
+        frozen = f"cannot delete field {name!r}"
+        raise FrozenInstanceError(frozen)
 
     async def get[T](self, typ: type[T]) -> T:
         """
@@ -82,36 +260,390 @@ class Scope:
                 parent, this error will be raised.
 
         """
-        if typ in self.cache:
-            return self.cache[typ]  # pyright: ignore[reportAny]
+        if (value := self.cache.get(typ, _MISSING)) is not _MISSING:  # pyright: ignore[reportAny]
+            return value  # pyright: ignore[reportAny]
 
-        if (provider := self.providers.get(typ)) is None and self.parent:
-            return await self.parent.get(typ)
-
-        if provider is None:
+        batch = _Batch(self._get_plan(typ), self._scopes)
+        self._prepare(batch)
+        ((_, ref),) = batch.plan.targets
+        if not self._found(ref, batch):
             no_provider = f"Unable to locate provider for {typ=} at {self.level=}"
             raise ProviderNotFoundError(no_provider)
 
-        keywords = {
-            key: await self.get(val)
-            for key, val in provider.args.items()
+        await self._run(batch)
+        return await self._arg(ref, batch)  # pyright: ignore[reportAny]
+
+    def _get_plan(self, typ: type[Any]) -> Plan:
+        try:
+            plans = self._plans.get(typ)
+        except TypeError:
+            return self.compile({"": typ})
+
+        if plans is not None and (plan := plans.get(self.level)) is not None:
+            return plan
+
+        # Types without a provider are not kept, so the cache only grows with the
+        # resolver's own providers.
+        plan = self.compile({"": typ})
+        if plan.targets[0][1].node is not None:
+            self._plans.setdefault(typ, {})[self.level] = plan
+        return plan
+
+    async def collect(self, typs: Mapping[str, type[Any]]) -> dict[str, Any]:
+        """
+        Create instances of several types at once.
+
+        This is a shortcut for executing a freshly compiled plan.
+
+        Args:
+            typs (Mapping[str, type[Any]]): The types to instantiate, by name.
+
+        Returns:
+            dict[str, Any]: Instances of the requested types, by name. Types
+            without a provider are left out.
+
+        """
+        return await self.execute(self.compile(typs))
+
+    def compile(self, typs: Mapping[str, type[Any]]) -> Plan:
+        """
+        Work out which providers could be used to create several types.
+
+        Every type is looked up through this scope's providers, then those of its
+        parents, following the arguments of each provider found.
+
+        Args:
+            typs (Mapping[str, type[Any]]): The types to plan for, by name.
+
+        Returns:
+            :py:class:`.Plan`: A plan that can be passed to
+            :py:meth:`prereq.resolve.Scope.execute`.
+
+        """
+        chain = [(scope.level, scope.providers) for scope in self._scopes.values()]
+        steps: dict[_Node, _Step] = {}
+        stack: list[tuple[_Node, int]] = []
+
+        def ref(start: int, typ: type[Any]) -> _Ref:
+            for index in range(start, len(chain)):
+                level, providers = chain[index]
+                if (provider := providers.get(typ)) is None:
+                    continue
+
+                node = (level, typ)
+                if node not in steps:
+                    tag = provider.kind
+                    invoke = provider.factory if tag in {_SYNC, _ASYNC} else provider
+                    names = tuple(provider.args)
+                    steps[node] = _Step(
+                        provider,
+                        tag,
+                        invoke,
+                        _positional(provider.factory, names),
+                        provider.never_cache,
+                        names,
+                        (),
+                        frozenset(),
+                    )
+                    stack.append((node, index))
+                nodes = tuple((level, typ) for level, _ in chain[start:index + 1])
+                return _Ref(typ, nodes, node)
+
+            return _Ref(typ, tuple((level, typ) for level, _ in chain[start:]), None)
+
+        targets = tuple((key, ref(0, val)) for key, val in typs.items())
+        while stack:
+            node, index = stack.pop()
+            step = steps[node]
+            steps[node] = step._replace(refs=tuple(
+                ref(index, val) for val in step.provider.args.values()
+            ))
+
+        sorter = TopologicalSorter({
+            node: [dep.node for dep in step.refs if dep.node is not None]
+            for node, step in steps.items()
+        })
+        try:
+            order = tuple(sorter.static_order())
+        except CycleError:
+            order = None
+
+        awaits = _link(steps, tuple(steps) if order is None else order)
+        caches = frozenset(
+            node for node, step in steps.items()
+            if not step.never_cache and step.provider.level == node[0]
+        )
+        return Plan(targets, steps, order, awaits, caches)
+
+    async def execute(self, plan: Plan) -> dict[str, Any]:
+        """
+        Create instances of the types in a plan.
+
+        Dependencies are gathered into a single graph. Each provider is started as
+        soon as its own dependencies are ready, so independent asynchronous
+        providers run concurrently.
+
+        Args:
+            plan (:py:class:`.Plan`): A plan compiled for this scope's level.
+
+        Returns:
+            dict[str, Any]: Instances of the planned types, by name. Types
+            without a provider are left out.
+
+        """
+        batch = _Batch(plan, self._scopes)
+        self._prepare(batch)
+        await self._run(batch)
+        return {
+            key: await self._arg(ref, batch)
+            for key, ref in plan.targets if self._found(ref, batch)
         }
 
-        if isinstance(provider, SyncProvider):
-            value = provider(**keywords)  # pyright: ignore[reportAny]
-        elif isinstance(provider, AsyncProvider):
-            value = await provider(**keywords)  # pyright: ignore[reportAny]
-        elif isinstance(provider, SyncProviderGen):
-            ctx = provider(**keywords)
-            self._ctx.append(ctx)
-            value = ctx.__enter__()  # pyright: ignore[reportAny]
+    def _collect_sync(self, plan: Plan) -> dict[str, Any]:
+        batch = _Batch(plan, self._scopes)
+        self._prepare(batch)
+        self._run_sync(batch)
+        return {
+            key: self._arg_sync(ref, batch)
+            for key, ref in plan.targets if self._found(ref, batch)
+        }
+
+    def _lookup(self, ref: _Ref, batch: _Batch) -> _Node | None:
+        typ, nodes, node = ref
+        scopes = batch.scopes
+        for level, _ in nodes:
+            if (value := scopes[level].cache.get(typ, _MISSING)) is not _MISSING:  # pyright: ignore[reportAny]
+                batch.values[level, typ] = value
+                return level, typ
+        return node
+
+    def _walk(self, batch: _Batch) -> bool:
+        steps = batch.plan.steps
+        values, needed, missing = batch.values, batch.needed, batch.missing
+        found = True
+
+        stack = [ref for _, ref in batch.plan.targets]
+        while stack:
+            if (node := self._lookup(stack.pop(), batch)) is None:
+                found = False
+            elif node not in values and node not in needed and node not in missing:
+                needed.add(node)
+                stack.extend(steps[node].refs)
+        return found
+
+    def _prepare(self, batch: _Batch) -> None:
+        if not self._walk(batch):
+            self._prune(batch)
+        if (order := batch.plan.order) is None:
+            order = self._sort(batch)
+        batch.order = order
+
+    def _prune(self, batch: _Batch) -> None:
+        # Something has no provider. Leave out every provider that depends on it,
+        # then look again, so that nothing is created for a type that is skipped.
+        # Providers may depend on each other in a loop, so this repeats until
+        # nothing changes, rather than following the plan's order.
+        steps, values, needed = batch.plan.steps, batch.values, batch.needed
+        missing = batch.missing
+        changed = True
+        while changed:
+            changed = False
+            for node in needed:
+                if node not in missing and any(
+                    (dep := _dep(ref, values)) is None or dep in missing
+                    for ref in steps[node].refs
+                ):
+                    missing.add(node)
+                    changed = True
+        needed.clear()
+        _ = self._walk(batch)
+
+    def _sort(self, batch: _Batch) -> tuple[_Node, ...]:
+        steps, values, needed = batch.plan.steps, batch.values, batch.needed
+        sorter = TopologicalSorter({
+            node: [
+                dep for ref in steps[node].refs
+                if (dep := _dep(ref, values)) in needed
+            ]
+            for node in needed
+        })
+        return tuple(sorter.static_order())
+
+    def _found(self, ref: _Ref, batch: _Batch) -> bool:
+        node = _dep(ref, batch.values)
+        return node is not None and node not in batch.missing
+
+    async def _run(self, batch: _Batch) -> None:
+        plan = batch.plan
+        steps, values, needed = plan.steps, batch.values, batch.needed
+        if len(blocking := needed & plan.awaits) > 1:
+            await self._schedule(batch)
+            return
+
+        # With at most one provider to await, nothing can run concurrently, so
+        # everything is built in plan order.
+        for node in batch.order:
+            if node not in needed or steps[node].never_cache:
+                continue
+            if node in blocking:
+                values[node] = await self._build(node, batch)
+            else:
+                values[node] = self._build_sync(node, batch)
+
+    async def _schedule(self, batch: _Batch) -> None:
+        plan, values = batch.plan, batch.values
+        todo = [
+            node for node in batch.order
+            if node in batch.needed and not plan.steps[node].never_cache
+        ]
+        waiting = set(todo)
+        pending: dict[Task[Any], _Node] = {}
+
+        try:
+            while todo or pending:
+                ready = self._ready(todo, waiting, batch)
+                if not ready and not pending and todo:
+                    # A cached value broke a loop that the plan still waits on.
+                    # Everything before the next step in order is built already.
+                    ready = [todo.pop(0)]
+                if len(ready) == 1 and not pending:
+                    values[ready[0]] = await self._build(ready[0], batch)
+                    waiting.discard(ready[0])
+                    continue
+
+                # Tasks start eagerly, so providers that finish without suspending
+                # never wait on the event loop.
+                loop = get_running_loop()
+                for node in ready:
+                    task = Task(self._build(node, batch), loop=loop, eager_start=True)
+                    pending[task] = node
+                if not pending:
+                    continue
+
+                done = [task for task in pending if task.done()]
+                if not done:
+                    done, _ = await wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    node = pending.pop(task)
+                    values[node] = task.result()
+                    waiting.discard(node)
+        finally:
+            if pending:
+                for task in pending:
+                    _ = task.cancel()
+                _ = await gather(*pending, return_exceptions=True)
+
+    def _ready(
+        self,
+        todo: list[_Node],
+        waiting: set[_Node],
+        batch: _Batch,
+    ) -> list[_Node]:
+        steps, values = batch.plan.steps, batch.values
+        ready: list[_Node] = []
+        later: list[_Node] = []
+
+        # Providers that don't need awaiting are built straight away. Plan order
+        # puts dependencies first, so one pass builds every chain of them.
+        for node in todo:
+            if not waiting.isdisjoint(steps[node].requires):
+                later.append(node)
+            elif node in batch.plan.awaits:
+                ready.append(node)
+            else:
+                values[node] = self._build_sync(node, batch)
+                waiting.discard(node)
+
+        todo[:] = later
+        return ready
+
+    async def _arg(self, ref: _Ref, batch: _Batch) -> Any:  # noqa: ANN401  # pyright: ignore[reportAny]
+        if (value := _hit(ref, batch.values)) is not _MISSING:  # pyright: ignore[reportAny]
+            return value  # pyright: ignore[reportAny]
+        if ref.node in batch.plan.awaits:
+            return await self._build(ref.node, batch)  # pyright: ignore[reportAny]
+        return self._build_sync(ref.node, batch)  # pyright: ignore[reportAny, reportArgumentType]
+
+    async def _gather(self, deps: list[_Node], batch: _Batch) -> list[Any]:
+        loop = get_running_loop()
+        tasks = [
+            Task(self._build(dep, batch), loop=loop, eager_start=True) for dep in deps
+        ]
+        try:
+            return await gather(*tasks)
+        finally:
+            for task in tasks:
+                _ = task.cancel()
+            _ = await gather(*tasks, return_exceptions=True)
+
+    async def _fresh(
+        self,
+        values: list[Any],
+        refs: tuple[_Ref, ...],
+        batch: _Batch,
+    ) -> None:
+        fresh = [
+            index for index, value in enumerate(values)  # pyright: ignore[reportAny]
+            if value is _MISSING and refs[index].node in batch.plan.awaits
+        ]
+        if len(fresh) > 1:
+            gathered = await self._gather([refs[index].node for index in fresh], batch)  # pyright: ignore[reportArgumentType]
+            for index, value in zip(fresh, gathered, strict=True):  # pyright: ignore[reportAny]
+                values[index] = value
+        for index, value in enumerate(values):  # pyright: ignore[reportAny]
+            if value is _MISSING:
+                values[index] = await self._arg(refs[index], batch)
+
+    async def _build(self, node: _Node, batch: _Batch) -> Any:  # noqa: ANN401  # pyright: ignore[reportAny]
+        scope = batch.scopes[node[0]]
+        _, tag, invoke, positional, _, names, refs, _ = batch.plan.steps[node]
+
+        values = [_hit(ref, batch.values) for ref in refs]
+        if _MISSING in values:
+            await self._fresh(values, refs, batch)
+
+        if positional:
+            result = invoke(*values)  # pyright: ignore[reportAny]
+        else:
+            result = invoke(**dict(zip(names, values, strict=True)))  # pyright: ignore[reportAny]
+        if tag == _SYNC:
+            value = result  # pyright: ignore[reportAny]
+        elif tag == _ASYNC:
+            value = await result  # pyright: ignore[reportAny]
+        elif tag == _SYNC_GEN:
+            value = scope._exits.enter_context(result)  # noqa: SLF001  # pyright: ignore[reportAny]
+        else:
+            value = await scope._exits.enter_async_context(result)  # noqa: SLF001  # pyright: ignore[reportAny]
+
+        if node in batch.plan.caches:
+            scope.cache[node[1]] = value
+        return value  # pyright: ignore[reportAny]
+
+    def _run_sync(self, batch: _Batch) -> None:
+        steps, values, needed = batch.plan.steps, batch.values, batch.needed
+        for node in batch.order:
+            if node in needed and not steps[node].never_cache:
+                values[node] = self._build_sync(node, batch)
+
+    def _arg_sync(self, ref: _Ref, batch: _Batch) -> Any:  # noqa: ANN401  # pyright: ignore[reportAny]
+        if (value := _hit(ref, batch.values)) is not _MISSING:  # pyright: ignore[reportAny]
+            return value  # pyright: ignore[reportAny]
+        return self._build_sync(ref.node, batch)  # pyright: ignore[reportAny, reportArgumentType]
+
+    def _build_sync(self, node: _Node, batch: _Batch) -> Any:  # noqa: ANN401  # pyright: ignore[reportAny]
+        scope = batch.scopes[node[0]]
+        _, tag, invoke, positional, _, names, refs, _ = batch.plan.steps[node]
+
+        values = [self._arg_sync(ref, batch) for ref in refs]
+        if positional:
+            value = invoke(*values)  # pyright: ignore[reportAny]
         else:
-            ctx = provider(**keywords)
-            self._ctx.append(ctx)
-            value = await ctx.__aenter__()  # pyright: ignore[reportAny]
+            value = invoke(**dict(zip(names, values, strict=True)))  # pyright: ignore[reportAny]
+        if tag == _SYNC_GEN:
+            value = scope._exits.enter_context(value)  # noqa: SLF001  # pyright: ignore[reportAny]
 
-        if not provider.never_cache and provider.level == self.level:
-            self.cache[typ] = value
+        if node in batch.plan.caches:
+            scope.cache[node[1]] = value
         return value  # pyright: ignore[reportAny]
 
     async def cleanup(self) -> None:
@@ -120,14 +652,9 @@ class Scope:
 
         Some providers are context managers that need to be exited when
         the scope is left. This method exits all pending context managers
-        created by the scope.
+        created by the scope, most recent first.
         """
-        for ctx in self._ctx:
-            if isinstance(ctx, AbstractAsyncContextManager):
-                _ = await ctx.__aexit__(None, None, None)
-                continue
-            _ = ctx.__exit__(None, None, None)
-        self._ctx.clear()
+        await self._exits.aclose()
 
 
 @dataclass(slots=True, frozen=True)
@@ -151,6 +678,19 @@ class Resolver:
         int,
         dict[type[Any], Providers],
     ] = field(default_factory=lambda: defaultdict(dict))
+    _plans: WeakKeyDictionary[
+        Callable[..., Any],
+        dict[int, Plan],
+    ] = field(default_factory=WeakKeyDictionary)
+    _typ_plans: dict[
+        type[Any],
+        dict[int, Plan],
+    ] = field(default_factory=dict)
+    _views: dict[
+        int,
+        MappingProxyType[type[Any], Providers],
+    ] = field(default_factory=dict)
+    _pool: list[Scope] = field(default_factory=list)
 
     @asynccontextmanager
     async def __call__(
@@ -189,6 +729,9 @@ class Resolver:
                 self.level + 1,
                 scope,
                 self._dep_map,
+                self._plans,
+                self._typ_plans,
+                self._views,
             )
         finally:
             await scope.cleanup()
@@ -210,14 +753,62 @@ class Resolver:
             self._dep_map[provider.level].update(
                 dict.fromkeys(provider.coverage, provider),
             )
+        self._plans.clear()
+        self._typ_plans.clear()
+
+    def freeze(self) -> Mapping[int, Mapping[type[Any], Providers]]:
+        """
+        Take a read-only snapshot of the resolver's providers.
+
+        The snapshot can be handed to :py:meth:`prereq.Resolver.from_registry` to
+        create more resolvers with the same providers, without registering each
+        provider again.
+
+        Returns:
+            (Mapping[int, Mapping[type[Any], Providers]]): Providers by level,
+            then by the type they cover.
+
+        """
+        return MappingProxyType({
+            level: MappingProxyType(dict(providers))
+            for level, providers in self._dep_map.items()
+        })
+
+    @classmethod
+    def from_registry(
+        cls,
+        registry: Mapping[int, Mapping[type[Any], Providers]],
+        level: int = 1,
+    ) -> Resolver:
+        """
+        Create a resolver from a snapshot taken by :py:meth:`prereq.Resolver.freeze`.
+
+        The new resolver gets its own copy of the providers, so adding providers to
+        it does not affect the snapshot or other resolvers made from it.
+
+        Args:
+            registry (Mapping[int, Mapping[type[Any], Providers]]): Providers by
+                level, then by the type they cover.
+            level (int): The level the new resolver operates on. Defaults to 1.
+
+        Returns:
+            :py:class:`.Resolver`: A resolver with the snapshot's providers.
+
+        """
+        dep_map: defaultdict[int, dict[type[Any], Providers]] = defaultdict(dict)
+        for provider_level, providers in registry.items():
+            dep_map[provider_level] = dict(providers)
+        return cls(level, None, dep_map)
 
     def _create_scope(self) -> Scope:
+        if (providers := self._views.get(self.level)) is None:
+            providers = MappingProxyType(self._dep_map[self.level])
+            self._views[self.level] = providers
         return Scope(
             parent=self._parent,
             level=self.level,
-            providers=MappingProxyType(
-                self._dep_map[self.level],
-            ),
+            providers=providers,
+            plans=self._typ_plans,
         )
 
     @asynccontextmanager
@@ -249,22 +840,29 @@ class Resolver:
             non-typed parameters.
 
         """
-        scope = self._create_scope()
+        scope = self._pool.pop() if self._pool else self._create_scope()
         if cache:
             scope.cache.update(cache)
 
-        hints: dict[str, type[Any]] = get_type_hints(func)
-        _ = hints.pop("return", None)
-        resolved: dict[str, Any] = {}
-
         try:
-            for key, val in hints.items():
-                try:
-                    value = await scope.get(val)  # pyright: ignore[reportAny]
-                except ProviderNotFoundError:
-                    continue
-                resolved[key] = value
-
-            yield resolved
+            plan = self._get_plan(func, scope)
+            if plan.awaits:
+                yield await scope.execute(plan)
+            else:
+                yield scope._collect_sync(plan)  # noqa: SLF001  # pyright: ignore[reportPrivateUsage]
         finally:
             await scope.cleanup()
+            scope.cache.clear()
+            self._pool.append(scope)
+
+    def _get_plan(self, func: Callable[..., Any], scope: Scope) -> Plan:
+        try:
+            plans = self._plans.setdefault(getattr(func, "__func__", func), {})
+        except TypeError:
+            plans: dict[int, Plan] = {}
+
+        if (plan := plans.get(self.level)) is None:
+            hints: dict[str, type[Any]] = _get_type_hints(func)
+            _ = hints.pop("return", None)
+            plan = plans[self.level] = scope.compile(hints)
+        return plan
@@ -1,8 +1,10 @@
 """Test Asynchronous Functions."""
 
+import asyncio
 from collections import Counter
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
 from dataclasses import dataclass
+from inspect import markcoroutinefunction
 from typing import Protocol
 
 from prereq import (
@@ -89,3 +91,149 @@ async def test_async() -> None:
         "C": 1,
         "D": 1,
     }
+
+
+async def test_concurrent() -> None:
+    a_started = asyncio.Event()
+    c_started = asyncio.Event()
+
+    @provides
+    async def create_a() -> A:
+        a_started.set()
+        _ = await c_started.wait()
+        return A(value=1)
+
+    @provides
+    async def create_c() -> C:
+        c_started.set()
+        _ = await a_started.wait()
+        return C(value=2)
+
+    def test_func(a: A, c: C) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a, create_c)
+
+    async with asyncio.timeout(1), resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1), "c": C(value=2)}
+
+
+async def test_eager_dispatch() -> None:
+    c_started = asyncio.Event()
+
+    @provides
+    async def create_a() -> A:
+        return A(value=1)
+
+    @provides
+    async def create_b() -> B:
+        _ = await c_started.wait()
+        return B(value=2, name="B")
+
+    @provides
+    async def create_c(a: A) -> C:
+        c_started.set()
+        return C(value=a.value + 2)
+
+    def test_func(b: B, c: C) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a, create_b, create_c)
+
+    async with asyncio.timeout(1), resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"b": B(value=2, name="B"), "c": C(value=3)}
+
+
+async def test_concurrent_uncached() -> None:
+    a_started = asyncio.Event()
+    c_started = asyncio.Event()
+
+    @provides(never_cache=True)
+    async def create_a() -> A:
+        a_started.set()
+        _ = await c_started.wait()
+        return A(value=1)
+
+    @provides(never_cache=True)
+    async def create_c() -> C:
+        c_started.set()
+        _ = await a_started.wait()
+        return C(value=2)
+
+    @provides
+    def create_d(a: A, c: C) -> D:
+        return D(value=a.value + c.value)
+
+    def test_func(d: D) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a, create_c, create_d)
+
+    async with asyncio.timeout(1), resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"d": D(value=3)}
+
+
+async def test_marked_coroutine() -> None:
+
+    async def make_a() -> A:
+        return A(value=1)
+
+    @markcoroutinefunction
+    def create_a() -> A:
+        return make_a()  # pyright: ignore[reportReturnType]
+
+    provider = provides(create_a)
+    assert isinstance(provider, AsyncProvider)
+
+    def test_func(a: A) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(provider)
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1)}
+
+
+async def test_generator_cleanup() -> None:
+    events: list[str] = []
+
+    @provides
+    async def create_a() -> AsyncGenerator[A]:
+        events.append("enter")
+        yield A(value=1)
+        events.append("exit")
+
+    def test_func(a: A) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a)
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1)}
+        assert events == ["enter"]
+
+    assert events == ["enter", "exit"]
+
+
+async def test_cleanup_order() -> None:
+    events: list[str] = []
+
+    @provides
+    def create_a() -> Generator[A]:
+        yield A(value=1)
+        events.append("A")
+
+    @provides
+    async def create_c(a: A) -> AsyncGenerator[C]:
+        yield C(value=a.value + 1)
+        events.append("C")
+
+    def test_func(c: C) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a, create_c)
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"c": C(value=2)}
+
+    assert events == ["C", "A"]
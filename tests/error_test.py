@@ -1,12 +1,17 @@
 """Test exceptions raised by Prereq."""
 
-
+import asyncio
+from collections.abc import AsyncGenerator, Generator
 from enum import Enum
 from typing import Literal
 
 import pytest
 
-from prereq import provides
+from prereq import Resolver, provides
+from prereq.provide import (
+    _AsyncGeneratorContext,  # pyright: ignore[reportPrivateUsage]
+    _GeneratorContext,  # pyright: ignore[reportPrivateUsage]
+)
 
 
 class A: ...
@@ -35,3 +40,85 @@ def test_bad_level() -> None:
     with pytest.raises(TypeError):
         @provides(level=Level.TWO)
         def weird_level() -> A: ...  # pyright: ignore[reportUnusedFunction]
+
+
+async def test_provider_error() -> None:
+    cancelled = asyncio.Event()
+
+    class B: ...
+
+    @provides
+    async def create_a() -> A:
+        bad_value = "A is unavailable"
+        raise ValueError(bad_value)
+
+    @provides
+    async def create_b() -> B:
+        try:
+            await asyncio.sleep(1)
+        finally:
+            cancelled.set()
+        return B()
+
+    def test_func(a: A, b: B) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a, create_b)
+
+    with pytest.raises(ValueError, match="unavailable"):
+        async with resolver.resolve(test_func):
+            pass
+
+    assert cancelled.is_set()
+
+
+async def test_generator_yields_twice() -> None:
+    events: list[str] = []
+
+    class B: ...
+
+    @provides
+    def create_a() -> Generator[A]:
+        try:
+            yield A()
+            yield A()
+        finally:
+            events.append("A")
+
+    @provides
+    async def create_b() -> AsyncGenerator[B]:
+        try:
+            yield B()
+            yield B()
+        finally:
+            events.append("B")
+
+    def test_func(a: A, b: B) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a, create_b)
+
+    with pytest.raises(RuntimeError, match="didn't stop"):
+        async with resolver.resolve(test_func):
+            pass
+
+    assert events == ["B", "A"]
+
+
+async def test_generator_stop_iteration() -> None:
+
+    def create_a() -> Generator[A]:
+        yield A()
+
+    async def create_b() -> AsyncGenerator[A]:
+        yield A()
+
+    context = _GeneratorContext(create_a())
+    _ = context.__enter__()
+    stop = StopIteration()
+    assert context.__exit__(StopIteration, stop, None) is False
+
+    for error in (StopIteration(), StopAsyncIteration()):
+        async_context = _AsyncGeneratorContext(create_b())
+        _ = await async_context.__aenter__()
+        assert await async_context.__aexit__(type(error), error, None) is False
@@ -1,11 +1,20 @@
 """Test Synchronous Functions."""
 
+import gc
+import sys
 from collections import Counter
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from dataclasses import dataclass
+from itertools import pairwise
+from types import MappingProxyType
 from typing import Protocol
+from weakref import ref
+
+import pytest
 
 from prereq import Resolver, SyncProvider, SyncProviderGen, provides
+from prereq.errors import ProviderNotFoundError
+from prereq.resolve import Scope
 
 
 @dataclass
@@ -42,6 +51,7 @@ async def test_sync() -> None:
         return A(value=10)
 
     assert isinstance(create_a, SyncProvider)
+    assert not hasattr(create_a, "__dict__")
 
     @provides
     def create_b(a: A) -> Generator[B]:
@@ -106,3 +116,248 @@ async def test_custom_cache() -> None:
     async with resolver.resolve(test_b, {A: A(5)}) as kwargs:
         test_b(**kwargs)  # pyright: ignore[reportAny]
 
+
+
+async def test_cover_parents() -> None:
+
+    class Base: ...
+
+    class Left(Base): ...
+
+    class Right(Base): ...
+
+    class Child(Left, Right, NamedValue):
+        value: int = 1
+        name: str = "child"
+
+    @provides
+    def create_child() -> Child:
+        return Child()
+
+    assert [*create_child.coverage] == [Child, Left, Right, Base, NamedValue]
+
+
+async def test_generator_cleanup() -> None:
+    events: list[str] = []
+
+    @provides
+    def create_a() -> Generator[A]:
+        events.append("enter")
+        yield A(value=1)
+        events.append("exit")
+
+    def test_func(a: A) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a)
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1)}
+        assert events == ["enter"]
+
+    assert events == ["enter", "exit"]
+
+
+async def test_plan_reuse() -> None:
+
+    @provides
+    def create_a() -> A:
+        return A(value=1)
+
+    @provides
+    def create_b(a: A) -> B:
+        return B(value=a.value + 1, name="B")
+
+    def test_func(a: A, b: B) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a)
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1)}
+
+    resolver.add_providers(create_b)
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1), "b": B(value=2, name="B")}
+
+    async with resolver.resolve(test_func, {A: A(value=5)}) as kwargs:
+        assert kwargs == {"a": A(value=5), "b": B(value=6, name="B")}
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1), "b": B(value=2, name="B")}
+
+
+async def test_string_annotations() -> None:
+
+    @provides
+    def create_a() -> "A":
+        return A(value=1)
+
+    def test_func(a: "A") -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a)
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1)}
+
+
+def test_reused_decorator() -> None:
+    provide_app = provides(level=2)  # pyright: ignore[reportUnknownVariableType]
+
+    def create_a() -> A:
+        return A(value=1)
+
+    def create_c() -> C:
+        return C(value=2)
+
+    assert provide_app(create_a).coverage == (A,)
+    assert provide_app(create_c).coverage == (C,)
+
+
+async def test_registry() -> None:
+
+    @provides
+    def create_a() -> A:
+        return A(value=1)
+
+    @provides(level=2)
+    def create_c(a: A) -> C:
+        return C(value=a.value + 1)
+
+    def test_func(a: A, c: C) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    original = Resolver()
+    original.add_providers(create_a, create_c)
+    registry = original.freeze()
+
+    resolver = Resolver.from_registry(registry)
+    async with resolver() as second, second.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1), "c": C(value=2)}
+
+    @provides
+    def create_d() -> D:
+        return D(value=3)
+
+    resolver.add_providers(create_d)
+    assert D not in registry[1]
+
+
+async def test_plan_cache_is_weak() -> None:
+
+    @provides
+    def create_a() -> A:
+        return A(value=1)
+
+    resolver = Resolver()
+    resolver.add_providers(create_a)
+
+    def test_func(a: A) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"a": A(value=1)}
+
+    func_ref = ref(test_func)
+    del test_func
+    _ = gc.collect()
+    assert func_ref() is None
+
+
+
+async def test_missing_type_released() -> None:
+    typ = type("T", (), {})
+    scope = Scope(None, 1, MappingProxyType({}))
+    with pytest.raises(ProviderNotFoundError):
+        _ = await scope.get(typ)
+
+    typ_ref = ref(typ)
+    del typ
+    _ = gc.collect()
+    assert typ_ref() is None
+
+async def test_deep_chain() -> None:
+    depth = sys.getrecursionlimit() * 2
+    typs = [type(f"T{index}", (), {}) for index in range(depth)]
+
+    def factory(typ: type) -> Callable[[object], object]:
+        def create(parent: object) -> object:  # noqa: ARG001  # pyright: ignore[reportUnusedParameter]
+            return typ()  # pyright: ignore[reportAny]
+        return create
+
+    resolver = Resolver()
+    resolver.add_providers(SyncProvider((typs[0],), {}, 1, False, typs[0]))  # noqa: FBT003
+    for parent, child in pairwise(typs):
+        provider = SyncProvider((child,), {"parent": parent}, 1, False, factory(child))  # noqa: FBT003
+        resolver.add_providers(provider)
+
+    def test_func(value: object) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    test_func.__annotations__["value"] = typs[-1]
+    async with resolver.resolve(test_func) as kwargs:
+        assert isinstance(kwargs["value"], typs[-1])
+
+
+async def test_keyword_only() -> None:
+
+    @provides
+    def create_a() -> A:
+        return A(value=1)
+
+    @provides
+    def create_c(*, a: A) -> C:
+        return C(value=a.value + 1)
+
+    @provides
+    def create_d(c: C, *, a: A) -> D:
+        return D(value=a.value + c.value)
+
+    def test_func(d: D) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a, create_c, create_d)
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {"d": D(value=3)}
+
+
+async def test_cached_cycle() -> None:
+
+    @provides
+    def create_a(c: C) -> A:
+        return A(value=c.value + 1)
+
+    @provides
+    def create_c(a: A) -> C:
+        return C(value=a.value + 1)
+
+    def test_func(c: C) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a, create_c)
+
+    async with resolver.resolve(test_func, {A: A(5)}) as kwargs:
+        assert kwargs == {"c": C(value=6)}
+
+
+async def test_missing_cycle() -> None:
+
+    @provides
+    def create_a(c: C, d: D) -> A:
+        return A(value=c.value + d.value)
+
+    @provides
+    def create_c(a: A) -> C:
+        return C(value=a.value + 1)
+
+    def test_func(a: A, d: D) -> None: ...  # pyright: ignore[reportUnusedParameter]
+
+    resolver = Resolver()
+    resolver.add_providers(create_a, create_c)
+
+    async with resolver.resolve(test_func) as kwargs:
+        assert kwargs == {}
+
+    scope = Scope(None, 1, MappingProxyType({A: create_a, C: create_c}))
+    with pytest.raises(ProviderNotFoundError):
+        _ = await scope.get(A)